@@ -4,10 +4,18 @@ import yfinance as yf
 from datetime import datetime, timedelta
 import numpy as np
 import io
+from pandas.tseries.holiday import (
+    Holiday, GoodFriday, EasterMonday, USMartinLutherKingJr, USPresidentsDay, USMemorialDay,
+    USLaborDay, USThanksgivingDay, nearest_workday, next_monday, next_monday_or_tuesday, sunday_to_monday
+)
+from pandas.tseries.offsets import DateOffset
+from dateutil.relativedelta import MO
+from dateutil.easter import easter
 from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import numbers
 import re
+import plotly.express as px
 
 # Configuration de la page
 st.set_page_config(
@@ -177,6 +185,217 @@ for country, indices in index_categories.items():
     for name, ticker in indices.items():
         index_assets[name] = ticker
 
+# Dictionnaire de tous les actifs pour la comparaison entre onglets
+all_assets = {}
+for assets in [crypto_assets, stock_assets, currency_assets, resource_assets, index_assets]:
+    all_assets.update(assets)
+
+# Jours fériés communs à plusieurs places boursières
+new_year = Holiday("Jour de l'an", month=1, day=1)
+labour_day = Holiday("Fête du travail", month=5, day=1)
+christmas_eve = Holiday("Veille de Noël", month=12, day=24)
+christmas = Holiday("Noël", month=12, day=25)
+boxing_day = Holiday("Lendemain de Noël", month=12, day=26)
+new_year_eve = Holiday("Saint-Sylvestre", month=12, day=31)
+
+# Fonction pour calculer le jour de l'équinoxe au Japon (formule valable de 1980 à 2099)
+def japanese_equinox_day(year, base_day):
+    return int(base_day + 0.242194 * (year - 1980) - (year - 1980) // 4)
+
+
+# Observance de l'équinoxe de printemps (reporté au lundi s'il tombe un dimanche)
+def vernal_equinox(dt):
+    return sunday_to_monday(dt.replace(month=3, day=japanese_equinox_day(dt.year, 20.8431)))
+
+
+# Observance de l'équinoxe d'automne (reporté au lundi s'il tombe un dimanche)
+def autumnal_equinox(dt):
+    return sunday_to_monday(dt.replace(month=9, day=japanese_equinox_day(dt.year, 23.2488)))
+
+
+# Observance du jour férié pris entre le Respect des anciens et l'équinoxe d'automne
+# (sans objet certaines années : on renvoie alors l'équinoxe, déjà férié)
+def citizens_holiday(dt):
+    respect_day = dt.replace(month=9, day=1) + DateOffset(weekday=MO(3))
+    equinox = dt.replace(month=9, day=japanese_equinox_day(dt.year, 23.2488))
+    if (equinox - respect_day).days == 2:
+        return respect_day + timedelta(days=1)
+    return autumnal_equinox(dt)
+
+
+# Observance de la Golden Week : un jour férié tombant un dimanche est reporté au 6 mai
+def golden_week_substitute(dt):
+    if dt.weekday() == 6:
+        return dt.replace(month=5, day=6)
+    return dt
+
+
+# Observance de Ching Ming à Hong Kong (terme solaire du 4 ou 5 avril)
+# reporté au jour suivant s'il tombe un dimanche ou pendant les congés de Pâques
+def ching_ming(dt):
+    century_base = 4.81 if dt.year >= 2000 else 5.59
+    year = dt.year % 100
+    day = dt.replace(month=4, day=int(year * 0.2422 + century_base) - year // 4)
+
+    easter_sunday = pd.Timestamp(easter(dt.year))
+    easter_holidays = [easter_sunday + timedelta(days=offset) for offset in (-2, -1, 1)]
+    while day.weekday() == 6 or day in easter_holidays:
+        day += timedelta(days=1)
+    return day
+
+
+# Jours fériés des places boursières, organisés par pays
+# Ne sont pas modélisés :
+# - les fêtes du calendrier lunaire à Hong Kong (Nouvel an lunaire, anniversaire de Bouddha,
+#   Tuen Ng, lendemain de la mi-automne, Chung Yeung) et en Corée du Sud (Seollal, anniversaire
+#   de Bouddha, Chuseok) ;
+# - les jours d'élection en Corée du Sud ;
+# - les fermetures exceptionnelles (deuils nationaux, jubilés et couronnement au Royaume-Uni,
+#   typhons à Hong Kong, etc.)
+exchange_holidays = {
+    "États-Unis": [
+        Holiday("Jour de l'an", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-01-01", observance=nearest_workday),
+        Holiday("Fête de l'indépendance", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Noël", month=12, day=25, observance=nearest_workday)
+    ],
+    "France": [new_year, GoodFriday, EasterMonday, labour_day, christmas, boxing_day],
+    "Allemagne": [new_year, GoodFriday, EasterMonday, labour_day, christmas_eve, christmas, boxing_day, new_year_eve],
+    "Royaume-Uni": [
+        Holiday("Jour de l'an", month=1, day=1, observance=next_monday),
+        GoodFriday,
+        EasterMonday,
+        Holiday("Early May bank holiday", month=5, day=1, offset=DateOffset(weekday=MO(1))),
+        Holiday("Spring bank holiday", month=5, day=31, offset=DateOffset(weekday=MO(-1))),
+        Holiday("Summer bank holiday", month=8, day=31, offset=DateOffset(weekday=MO(-1))),
+        Holiday("Noël", month=12, day=25, observance=next_monday),
+        Holiday("Boxing Day", month=12, day=26, observance=next_monday_or_tuesday)
+    ],
+    "Japon": [
+        new_year,
+        Holiday("Congés du nouvel an", month=1, day=2),
+        Holiday("Congés du nouvel an", month=1, day=3),
+        Holiday("Jour de la majorité", month=1, day=15, end_date="1999-12-31", observance=sunday_to_monday),
+        Holiday("Jour de la majorité", month=1, day=1, start_date="2000-01-01", offset=DateOffset(weekday=MO(2))),
+        Holiday("Fondation de l'État", month=2, day=11, observance=sunday_to_monday),
+        Holiday("Anniversaire de l'empereur", month=2, day=23, start_date="2020-01-01", observance=sunday_to_monday),
+        Holiday("Équinoxe de printemps", month=3, day=1, observance=vernal_equinox),
+        Holiday("Jour de Shōwa", month=4, day=29, observance=sunday_to_monday),
+        Holiday("Jour de la Constitution", month=5, day=3, observance=golden_week_substitute),
+        Holiday("Jour de la verdure", month=5, day=4, observance=golden_week_substitute),
+        Holiday("Jour des enfants", month=5, day=5, observance=golden_week_substitute),
+        # Avènement de l'empereur en 2019
+        Holiday("Jour férié national", year=2019, month=4, day=30),
+        Holiday("Intronisation de l'empereur", year=2019, month=5, day=1),
+        Holiday("Jour férié national", year=2019, month=5, day=2),
+        Holiday("Cérémonie d'intronisation", year=2019, month=10, day=22),
+        Holiday("Jour de la mer", month=7, day=20, start_date="1996-01-01", end_date="2002-12-31",
+                observance=sunday_to_monday),
+        Holiday("Jour de la mer", month=7, day=1, start_date="2003-01-01", end_date="2019-12-31",
+                offset=DateOffset(weekday=MO(3))),
+        Holiday("Jour de la mer", month=7, day=1, start_date="2022-01-01", offset=DateOffset(weekday=MO(3))),
+        Holiday("Jour de la montagne", month=8, day=11, start_date="2016-01-01", end_date="2019-12-31",
+                observance=sunday_to_monday),
+        Holiday("Jour de la montagne", month=8, day=11, start_date="2022-01-01", observance=sunday_to_monday),
+        # Jours fériés déplacés pour les Jeux olympiques de Tokyo
+        Holiday("Jour de la mer", year=2020, month=7, day=23),
+        Holiday("Jour du sport", year=2020, month=7, day=24),
+        Holiday("Jour de la montagne", year=2020, month=8, day=10),
+        Holiday("Jour de la mer", year=2021, month=7, day=22),
+        Holiday("Jour du sport", year=2021, month=7, day=23),
+        Holiday("Jour de la montagne", year=2021, month=8, day=9),
+        Holiday("Respect des anciens", month=9, day=15, end_date="2002-12-31", observance=sunday_to_monday),
+        Holiday("Respect des anciens", month=9, day=1, start_date="2003-01-01", offset=DateOffset(weekday=MO(3))),
+        Holiday("Jour des citoyens", month=9, day=1, start_date="2003-01-01", observance=citizens_holiday),
+        Holiday("Équinoxe d'automne", month=9, day=1, observance=autumnal_equinox),
+        Holiday("Jour du sport", month=10, day=10, end_date="1999-12-31", observance=sunday_to_monday),
+        Holiday("Jour du sport", month=10, day=1, start_date="2000-01-01", end_date="2019-12-31",
+                offset=DateOffset(weekday=MO(2))),
+        Holiday("Jour du sport", month=10, day=1, start_date="2022-01-01", offset=DateOffset(weekday=MO(2))),
+        Holiday("Jour de la culture", month=11, day=3, observance=sunday_to_monday),
+        Holiday("Fête du travail", month=11, day=23, observance=sunday_to_monday),
+        Holiday("Anniversaire de l'empereur", month=12, day=23, start_date="1989-01-01", end_date="2018-12-31",
+                observance=sunday_to_monday),
+        new_year_eve
+    ],
+    "Hong Kong": [
+        Holiday("Jour de l'an", month=1, day=1, observance=sunday_to_monday),
+        GoodFriday,
+        EasterMonday,
+        Holiday("Ching Ming", month=4, day=1, observance=ching_ming),
+        Holiday("Fête du travail", month=5, day=1, observance=sunday_to_monday),
+        Holiday("Fête de la région administrative", month=7, day=1, observance=sunday_to_monday),
+        Holiday("Fête nationale", month=10, day=1, observance=sunday_to_monday),
+        Holiday("Noël", month=12, day=25, observance=sunday_to_monday),
+        Holiday("Lendemain de Noël", month=12, day=26, observance=next_monday_or_tuesday)
+    ],
+    "Australie": [
+        Holiday("Jour de l'an", month=1, day=1, observance=next_monday),
+        Holiday("Australia Day", month=1, day=26, observance=next_monday),
+        GoodFriday,
+        EasterMonday,
+        Holiday("Anzac Day", month=4, day=25),
+        Holiday("Anniversaire du souverain", month=6, day=1, offset=DateOffset(weekday=MO(2))),
+        Holiday("Noël", month=12, day=25, observance=next_monday),
+        Holiday("Boxing Day", month=12, day=26, observance=next_monday_or_tuesday)
+    ],
+    "Espagne": [new_year, GoodFriday, EasterMonday, labour_day, christmas, boxing_day],
+    "Italie": [new_year, GoodFriday, EasterMonday, labour_day, christmas_eve, christmas, boxing_day, new_year_eve],
+    "Corée du Sud": [
+        new_year,
+        Holiday("Mouvement du 1er mars", month=3, day=1, end_date="2021-07-31"),
+        Holiday("Mouvement du 1er mars", month=3, day=1, start_date="2021-08-01", observance=next_monday),
+        labour_day,
+        Holiday("Jour des enfants", month=5, day=5, end_date="2013-12-31"),
+        Holiday("Jour des enfants", month=5, day=5, start_date="2014-01-01", observance=next_monday),
+        Holiday("Jour du souvenir", month=6, day=6),
+        Holiday("Jour de la libération", month=8, day=15, end_date="2021-07-31"),
+        Holiday("Jour de la libération", month=8, day=15, start_date="2021-08-01", observance=next_monday),
+        Holiday("Fondation nationale", month=10, day=3, end_date="2021-07-31"),
+        Holiday("Fondation nationale", month=10, day=3, start_date="2021-08-01", observance=next_monday),
+        Holiday("Jour du hangeul", month=10, day=9, end_date="2021-07-31"),
+        Holiday("Jour du hangeul", month=10, day=9, start_date="2021-08-01", observance=next_monday),
+        Holiday("Noël", month=12, day=25, end_date="2022-12-31"),
+        Holiday("Noël", month=12, day=25, start_date="2023-01-01", observance=next_monday),
+        new_year_eve
+    ],
+    "Canada": [
+        Holiday("Jour de l'an", month=1, day=1, observance=next_monday),
+        Holiday("Family Day", month=2, day=1, offset=DateOffset(weekday=MO(3))),
+        GoodFriday,
+        Holiday("Fête de la Reine", month=5, day=24, offset=DateOffset(weekday=MO(-1))),
+        Holiday("Fête du Canada", month=7, day=1, observance=next_monday),
+        Holiday("Congé civique", month=8, day=1, offset=DateOffset(weekday=MO(1))),
+        Holiday("Fête du travail", month=9, day=1, offset=DateOffset(weekday=MO(1))),
+        Holiday("Action de grâce", month=10, day=1, offset=DateOffset(weekday=MO(2))),
+        Holiday("Noël", month=12, day=25, observance=next_monday),
+        Holiday("Boxing Day", month=12, day=26, observance=next_monday_or_tuesday)
+    ]
+}
+
+# Calendrier de cotation associé à chaque ticker :
+# "crypto" (7 jours sur 7), "forex" (du lundi au vendredi) ou le pays d'une place boursière
+ticker_calendars = {}
+for ticker in crypto_assets.values():
+    ticker_calendars[ticker] = "crypto"
+for ticker in currency_assets.values():
+    ticker_calendars[ticker] = "forex"
+# Actions (ADR comprises) et contrats à terme sont cotés aux États-Unis
+for ticker in list(stock_assets.values()) + list(resource_assets.values()):
+    ticker_calendars[ticker] = "États-Unis"
+for country, indices in index_categories.items():
+    for ticker in indices.values():
+        ticker_calendars[ticker] = country
+
+# Début des calendriers de cotation précalculés
+calendar_start = pd.Timestamp("1990-01-01")
+
 
 # Fonction pour nettoyer les noms de fichiers et les titres de feuilles Excel
 def clean_text(text):
@@ -246,8 +465,97 @@ def create_excel(data, sheet_name="Data"):
     return processed_data
 
 
+# Fonction pour retrouver le calendrier de cotation d'un ticker (jours ouvrés par défaut)
+def get_calendar_key(ticker_symbol):
+    return ticker_calendars.get(ticker_symbol, "forex")
+
+
+# Fonction pour précalculer l'index des séances d'un calendrier, jusqu'à la date de fin incluse
+# (la date du jour fait partie de la clé du cache : l'index change avec le jour)
+@st.cache_resource(ttl=timedelta(days=1))
+def build_trading_calendar(calendar_key, end_date):
+    calendar_end = pd.Timestamp(end_date)
+
+    if calendar_key == "crypto":
+        return pd.date_range(calendar_start, calendar_end, freq="D")
+
+    holidays = []
+    for rule in exchange_holidays.get(calendar_key, []):
+        holidays.extend(rule.dates(calendar_start, calendar_end))
+    return pd.bdate_range(calendar_start, calendar_end, freq="C", holidays=holidays)
+
+
+# Fonction pour extraire les séances comprises entre deux dates (fin exclue, comme yfinance)
+def get_trading_days(calendar_key, start_date, end_date):
+    calendar = build_trading_calendar(calendar_key, datetime.now().date())
+    return slice_calendar(calendar, start_date, end_date)
+
+
+# Fonction pour précalculer l'union de plusieurs calendriers (clé : frozenset de calendriers)
+@st.cache_resource(ttl=timedelta(days=1))
+def build_union_calendar(calendar_keys, end_date):
+    union_calendar = pd.DatetimeIndex([])
+    for calendar_key in sorted(calendar_keys):
+        union_calendar = union_calendar.union(build_trading_calendar(calendar_key, end_date))
+    return union_calendar
+
+
+# Fonction pour découper un calendrier précalculé entre deux dates (fin exclue)
+def slice_calendar(calendar, start_date, end_date):
+    start_pos = calendar.searchsorted(pd.Timestamp(start_date))
+    end_pos = calendar.searchsorted(pd.Timestamp(end_date))
+    return calendar[start_pos:end_pos]
+
+
+# Fonction pour ramener un index temporel à des dates sans heure ni fuseau horaire
+def normalize_dates(index):
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+# Fonction pour lister les séances attendues sans données (le jour courant, incomplet, est ignoré)
+def find_missing_days(data, trading_days):
+    today = pd.Timestamp(datetime.now().date())
+    expected_days = trading_days[trading_days < today]
+    return expected_days[~expected_days.isin(normalize_dates(data.index))]
+
+
+# Fonction pour aligner plusieurs séries de prix sur l'union des calendriers de leurs tickers
+def align_on_trading_days(prices, start_date, end_date):
+    calendar_keys = frozenset(get_calendar_key(ticker) for ticker in prices.columns)
+    calendar = build_union_calendar(calendar_keys, datetime.now().date())
+    trading_days = slice_calendar(calendar, start_date, end_date)
+
+    aligned = prices.copy()
+    aligned.index = normalize_dates(aligned.index)
+    # Conserver aussi les barres tombant un jour considéré comme férié : aucune donnée réelle n'est perdue
+    return aligned.reindex(trading_days.union(aligned.index))
+
+
+# Fonction pour afficher les séances manquantes d'une série
+def display_missing_days(data, trading_days):
+    missing_days = find_missing_days(data, trading_days)
+    if len(missing_days) > 0:
+        missing_str = ", ".join(d.strftime('%Y-%m-%d') for d in missing_days[:5])
+        if len(missing_days) > 5:
+            missing_str += ", ..."
+        st.info(f"{len(missing_days)} séance(s) de cotation sans données : {missing_str}")
+
+
+# Fonction pour récupérer en une seule requête les clôtures de plusieurs tickers
+@st.cache_data(ttl=3600)
+def download_closes(tickers, start_date, end_date):
+    data = yf.download(list(tickers), start=start_date, end=end_date, interval="1d")
+    closes = data['Close']
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(tickers[0])
+    return closes.reindex(columns=list(tickers))
+
+
 # Création des onglets principaux pour types d'actifs
-tab1, tab2, tab3, tab4, tab5 = st.tabs(["Crypto", "Actions", "Devises", "Ressources", "Indices"])
+tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["Crypto", "Actions", "Devises", "Ressources", "Indices", "Comparaison"])
 
 
 # Fonction pour afficher les crypto, devises, ressources
@@ -267,6 +575,18 @@ def display_standard_asset_data(assets, tab_key):
 
     # Récupération des données
     ticker_symbol = assets[selected_asset]
+
+    # Vérifier l'ordre des dates avant de consulter le calendrier de cotation
+    if start_date_input >= end_date_input:
+        st.error("La date de début doit être antérieure à la date de fin.")
+        return
+
+    # Éviter une requête inutile si la période ne contient aucune séance de cotation
+    trading_days = get_trading_days(get_calendar_key(ticker_symbol), start_date_input, end_date_input)
+    if len(trading_days) == 0:
+        st.warning(f"Aucune séance de cotation pour {selected_asset} dans la période sélectionnée (marché fermé).")
+        return
+
     try:
         # Récupérer les données avec un intervalle quotidien explicite
         data = yf.download(ticker_symbol, start=start_date_input, end=end_date_input, interval="1d")
@@ -307,6 +627,9 @@ def display_standard_asset_data(assets, tab_key):
                         vol_str = f"{latest_volume_value:.2f}"
                     st.metric("Volume (dernier jour)", vol_str)
 
+                # Signaler les trous réels dans les données (hors fermetures du marché)
+                display_missing_days(data, trading_days)
+
                 # Tableau des données
                 st.subheader("Données historiques")
 
@@ -415,6 +738,18 @@ def display_stock_data():
 
     # Récupération des données
     ticker_symbol = filtered_stocks[selected_asset]
+
+    # Vérifier l'ordre des dates avant de consulter le calendrier de cotation
+    if start_date_input >= end_date_input:
+        st.error("La date de début doit être antérieure à la date de fin.")
+        return
+
+    # Éviter une requête inutile si la période ne contient aucune séance de cotation
+    trading_days = get_trading_days(get_calendar_key(ticker_symbol), start_date_input, end_date_input)
+    if len(trading_days) == 0:
+        st.warning(f"Aucune séance de cotation pour {selected_asset} dans la période sélectionnée (marché fermé).")
+        return
+
     try:
         # Récupérer les données avec un intervalle quotidien explicite
         data = yf.download(ticker_symbol, start=start_date_input, end=end_date_input, interval="1d")
@@ -455,6 +790,9 @@ def display_stock_data():
                         vol_str = f"{latest_volume_value:.2f}"
                     st.metric("Volume (dernier jour)", vol_str)
 
+                # Signaler les trous réels dans les données (hors fermetures du marché)
+                display_missing_days(data, trading_days)
+
                 # Tableau des données
                 st.subheader("Données historiques")
 
@@ -562,6 +900,18 @@ def display_indices_data():
 
     # Récupération des données
     ticker_symbol = filtered_indices[selected_asset]
+
+    # Vérifier l'ordre des dates avant de consulter le calendrier de cotation
+    if start_date_input >= end_date_input:
+        st.error("La date de début doit être antérieure à la date de fin.")
+        return
+
+    # Éviter une requête inutile si la période ne contient aucune séance de cotation
+    trading_days = get_trading_days(get_calendar_key(ticker_symbol), start_date_input, end_date_input)
+    if len(trading_days) == 0:
+        st.warning(f"Aucune séance de cotation pour {selected_asset} dans la période sélectionnée (marché fermé).")
+        return
+
     try:
         # Récupérer les données avec un intervalle quotidien explicite
         data = yf.download(ticker_symbol, start=start_date_input, end=end_date_input, interval="1d")
@@ -602,6 +952,9 @@ def display_indices_data():
                         vol_str = f"{latest_volume_value:.2f}"
                     st.metric("Volume (dernier jour)", vol_str)
 
+                # Signaler les trous réels dans les données (hors fermetures du marché)
+                display_missing_days(data, trading_days)
+
                 # Tableau des données
                 st.subheader("Données historiques")
 
@@ -673,6 +1026,88 @@ def display_indices_data():
         st.error(f"Traceback détaillé: {traceback.format_exc()}")
 
 
+# Fonction pour comparer la performance relative de plusieurs actifs (base 100 au début)
+def display_comparison_data():
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        selected_assets = st.multiselect(
+            "Choisissez les actifs à comparer",
+            options=list(all_assets.keys()),
+            default=["Bitcoin", "S&P 500", "Or", "NVIDIA"],
+            key="select_comparison"
+        )
+
+    with col2:
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=365)
+        start_date_input = st.date_input("Date de début", value=start_date, key="start_comparison")
+
+    with col3:
+        end_date_input = st.date_input("Date de fin", value=end_date, key="end_comparison")
+
+    if not selected_assets:
+        st.info("Sélectionnez au moins un actif à comparer.")
+        return
+
+    tickers = tuple(all_assets[name] for name in selected_assets)
+
+    # Vérifier l'ordre des dates avant de consulter le calendrier de cotation
+    if start_date_input >= end_date_input:
+        st.error("La date de début doit être antérieure à la date de fin.")
+        return
+
+    # Éviter une requête inutile si aucun marché n'est ouvert sur la période
+    calendar_keys = {get_calendar_key(ticker) for ticker in tickers}
+    if all(len(get_trading_days(key, start_date_input, end_date_input)) == 0 for key in calendar_keys):
+        st.warning("Aucune séance de cotation pour les actifs sélectionnés dans la période sélectionnée (marché fermé).")
+        return
+
+    try:
+        closes = download_closes(tickers, start_date_input, end_date_input)
+
+        if closes.dropna(how='all').empty:
+            st.error("Aucune donnée disponible pour les actifs sélectionnés dans la période sélectionnée.")
+            return
+
+        # Alignement sur les séances de tous les calendriers puis base 100 à la première clôture de chaque actif
+        aligned = align_on_trading_days(closes, start_date_input, end_date_input)
+        rebased = aligned.ffill() / aligned.bfill().iloc[0] * 100
+        rebased.columns = selected_assets
+
+        # Graphique de performance relative
+        st.subheader("Performance relative (base 100)")
+        fig = px.line(rebased, labels={"index": "Date", "value": "Base 100", "variable": "Actif"})
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Tableau récapitulatif
+        st.subheader("Récapitulatif")
+
+        summary_data = pd.DataFrame(index=selected_assets)
+        summary_data['Ticker'] = list(tickers)
+
+        variations = []
+        for x in (rebased.iloc[-1] - 100).to_numpy():
+            if pd.isna(x):
+                variations.append("N/A")
+            else:
+                variations.append(f"{float(x):.2f}%")
+        summary_data['Variation'] = variations
+
+        missing_counts = []
+        for ticker in tickers:
+            trading_days = get_trading_days(get_calendar_key(ticker), start_date_input, end_date_input)
+            missing_counts.append(len(find_missing_days(closes[ticker].dropna(), trading_days)))
+        summary_data['Séances manquantes'] = missing_counts
+
+        st.dataframe(summary_data)
+
+    except Exception as e:
+        st.error(f"Une erreur s'est produite lors de la récupération des données : {e}")
+        import traceback
+        st.error(f"Traceback détaillé: {traceback.format_exc()}")
+
+
 # Affichage des données selon l'onglet sélectionné
 with tab1:
     display_standard_asset_data(crypto_assets, "crypto")
@@ -688,3 +1123,6 @@ with tab4:
 
 with tab5:
     display_indices_data()  # Fonction spéciale pour les indices avec filtrage par pays
+
+with tab6:
+    display_comparison_data()  # Comparaison de plusieurs actifs en base 100